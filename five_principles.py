@@ -1,21 +1,86 @@
 import csv
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from abc import ABC, abstractmethod
+import io
+import locale
+import os
+from operator import methodcaller
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+from typing import Iterable, Optional, Protocol
+from xml.sax.saxutils import escape
+
+# Compile the light selector once; the stdlib fallback relies on ElementPath's own path cache
+if hasattr(ET, "XPath"):
+    _user_defined_light_xpath = ET.XPath('(.//UserDefinedLight)[1]')
+
+    def _find_user_defined_light(action):
+        matches = _user_defined_light_xpath(action)
+        return matches[0] if matches else None
+else:
+    def _find_user_defined_light(action):
+        return action.find('.//UserDefinedLight')
+
+def _iterparse_detached(file, tag):
+    # Yield each finished <tag> element, then detach it from its parent. Elements outside any <tag>
+    # are detached as they finish too, so the partially built tree never grows with the file
+    ancestors = []
+    open_matches = 0
+    for event, element in ET.iterparse(file, events=("start", "end")):
+        if event == "start":
+            ancestors.append(element)
+            if element.tag == tag:
+                open_matches += 1
+            continue
+        ancestors.pop()
+        if element.tag == tag:
+            open_matches -= 1
+            yield element
+        if open_matches == 0 and ancestors:
+            ancestors[-1].remove(element)
 
 # Interface Segregation Principle (ISP)
-class CSVExportable(ABC):
-    @abstractmethod
+class CSVExportable(Protocol):
     def to_csv_row(self):
-        pass
+        ...
 
-class XMLExportable(ABC):
-    @abstractmethod
+class XMLExportable(Protocol):
     def to_xml_element(self):
-        pass
+        ...
+
+    def to_xml_bytes(self):
+        ...
+
+# Escapes for XML template values; quotes and whitespace become references so attributes round-trip
+_XML_ESCAPES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#09;'}
+
+class _EscapedFields:
+    # str.format_map view of an entity that XML-escapes each field as the template reads it
+    __slots__ = ('entity',)
+
+    def __init__(self, entity):
+        self.entity = entity
+
+    def __getitem__(self, field):
+        return escape(str(getattr(self.entity, field)), _XML_ESCAPES)
+
+# Entity classes implementing interfaces (structurally, no runtime ABC checks)
+class Entity:
+    __slots__ = ('entity_id', 'name')
+
+    # XML tag names, shared by every to_xml_element
+    _TAG = "Entity"
+    _NAME_TAG = "Name"
+
+    # Fixed-schema fast path for to_xml_bytes; None means serialize through to_xml_element
+    _XML_TEMPLATE: Optional[str] = '<Entity id="{entity_id}"><Name>{name}</Name></Entity>'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass that customizes to_xml_element without its own template is saved through that method
+        if 'to_xml_element' in vars(cls) and '_XML_TEMPLATE' not in vars(cls):
+            cls._XML_TEMPLATE = None
 
-# Entity classes implementing interfaces
-class Entity(CSVExportable, XMLExportable):
     def __init__(self, entity_id, name):
         self.entity_id = entity_id
         self.name = name
@@ -24,52 +89,97 @@ class Entity(CSVExportable, XMLExportable):
         return [self.entity_id, self.name]
 
     def to_xml_element(self):
-        entity_element = ET.Element("Entity", id=str(self.entity_id))
-        name_element = ET.SubElement(entity_element, "Name")
+        entity_element = ET.Element(self._TAG, id=str(self.entity_id))
+        name_element = ET.SubElement(entity_element, self._NAME_TAG)
         name_element.text = self.name
         return entity_element
 
+    def to_xml_bytes(self):
+        if self._XML_TEMPLATE is None:
+            return ET.tostring(self.to_xml_element())
+        # Fill the class's template instead of building an element tree
+        return self._XML_TEMPLATE.format_map(_EscapedFields(self)).encode('ascii', 'xmlcharrefreplace')
+
 class LightStateAction(Entity):
+    __slots__ = ('user_defined_light_type',)
+
+    _LIGHT_STATE_ACTION_TAG = "LightStateAction"
+    _LIGHT_TYPE_TAG = "LightType"
+    _USER_DEFINED_LIGHT_TAG = "UserDefinedLight"
+    _USER_DEFINED_LIGHT_TYPE_ATTRIB = "userDefinedLightType"
+
+    _XML_TEMPLATE = (
+        '<Entity id="{entity_id}"><Name>{name}</Name><LightStateAction><LightType>'
+        '<UserDefinedLight userDefinedLightType="{user_defined_light_type}" />'
+        '</LightType></LightStateAction></Entity>'
+    )
+
     def __init__(self, entity_id, name, user_defined_light_type):
         super().__init__(entity_id, name)
         self.user_defined_light_type = user_defined_light_type
 
     def to_csv_row(self):
-        return super().to_csv_row() + [self.user_defined_light_type]
+        return [self.entity_id, self.name, self.user_defined_light_type]
 
     def to_xml_element(self):
-        entity_element = super().to_xml_element()
-        light_state_action_element = ET.SubElement(entity_element, "LightStateAction")
-        light_type_element = ET.SubElement(light_state_action_element, "LightType")
-        user_defined_light_element = ET.SubElement(light_type_element, "UserDefinedLight")
-        user_defined_light_element.set("userDefinedLightType", self.user_defined_light_type)
+        entity_element = ET.Element(self._TAG, id=str(self.entity_id))
+        name_element = ET.SubElement(entity_element, self._NAME_TAG)
+        name_element.text = self.name
+        light_state_action_element = ET.SubElement(entity_element, self._LIGHT_STATE_ACTION_TAG)
+        light_type_element = ET.SubElement(light_state_action_element, self._LIGHT_TYPE_TAG)
+        user_defined_light_element = ET.SubElement(light_type_element, self._USER_DEFINED_LIGHT_TAG)
+        user_defined_light_element.set(self._USER_DEFINED_LIGHT_TYPE_ATTRIB, self.user_defined_light_type)
         return entity_element
 
 # Dependency Inversion Principle (DIP)
-class PersistenceHandler(ABC):
-    @abstractmethod
+class PersistenceHandler(Protocol):
     def save(self, entity: Entity):
-        pass
+        ...
+
+    def save_all(self, entities: Iterable[Entity]):
+        ...
+
+class CSVHandler:
+    _HEADER = ["Entity ID", "Name", "UserDefinedLightType"]
 
-class CSVHandler(PersistenceHandler):
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def save(self, entity: Entity):
-        with open(self.file_path, mode='w', newline='') as file:
+    def save(self, entity: CSVExportable):
+        # Two rows only: format in memory, then hand the bytes to the OS in one unbuffered write
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self._HEADER)
+        writer.writerow(entity.to_csv_row())
+        # Same encoding open() uses for save_all, so both methods agree on non-ASCII names
+        data = memoryview(buffer.getvalue().encode(locale.getpreferredencoding(False)))
+        fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            # os.write may write fewer bytes than asked; keep going until everything is out
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def save_all(self, entities: Iterable[CSVExportable]):
+        # Stream rows through a large buffer rather than building the whole file in memory
+        with open(self.file_path, mode='w', newline='', buffering=1 << 20) as file:
             writer = csv.writer(file)
-            writer.writerow(["Entity ID", "Name", "UserDefinedLightType"])
-            writer.writerow(entity.to_csv_row())
+            writer.writerow(self._HEADER)
+            writer.writerows(map(methodcaller('to_csv_row'), entities))
 
-class XMLHandler(PersistenceHandler):
+class XMLHandler:
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def save(self, entity: Entity):
-        root = ET.Element("Entities")
-        root.append(entity.to_xml_element())
-        tree = ET.ElementTree(root)
-        tree.write(self.file_path)
+    def save(self, entity: XMLExportable):
+        self.save_all([entity])
+
+    def save_all(self, entities: Iterable[XMLExportable]):
+        # Render each entity from its template and write the whole document at once
+        xml_bytes = b''.join([b'<Entities>', *map(methodcaller('to_xml_bytes'), entities), b'</Entities>'])
+        with open(self.file_path, 'wb') as file:
+            file.write(xml_bytes)
 
 # High-level module depending on abstraction
 class EntitySaver:
@@ -79,16 +189,21 @@ class EntitySaver:
     def save(self, entity: Entity):
         self.handler.save(entity)
 
+    def save_all(self, entities: Iterable[Entity]):
+        self.handler.save_all(entities)
+
 # Example XML parsing function to demonstrate reading the XML file
 def parse_xml(file_path):
-    tree = ET.parse(file_path)
-    root = tree.getroot()
     parsed_entities = []
-    for action in root.findall('.//PrivateAction'):
-        entity_id = 1  # Adjust as needed
-        name = "LightStateAction"
-        light_type = action.find('.//UserDefinedLight').get('userDefinedLightType')
-        parsed_entities.append(LightStateAction(entity_id, name, light_type))
+    # Stream the document, detaching each action once handled so memory stays flat
+    with open(file_path, 'rb', buffering=1 << 17) as file:
+        for action in _iterparse_detached(file, 'PrivateAction'):
+            user_defined_light = _find_user_defined_light(action)
+            if user_defined_light is not None:
+                entity_id = 1  # Adjust as needed
+                name = "LightStateAction"
+                light_type = user_defined_light.get('userDefinedLightType')
+                parsed_entities.append(LightStateAction(entity_id, name, light_type))
     return parsed_entities
 
 # Example usage demonstrating LSP
@@ -103,9 +218,8 @@ xml_handler = XMLHandler('entity.xml')
 csv_saver = EntitySaver(csv_handler)
 xml_saver = EntitySaver(xml_handler)
 
-for entity in entities:
-    csv_saver.save(entity)
-    xml_saver.save(entity)
+csv_saver.save_all(entities)
+xml_saver.save_all(entities)
 
 # Parsing the provided XML file
 parsed_entities = parse_xml('scenario.xml')
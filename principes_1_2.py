@@ -1,10 +1,39 @@
 import csv
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from array import array
+from collections import Counter
+from operator import methodcaller
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+def _iterparse_detached(file, tag):
+    # Yield each finished <tag> element, then detach it from its parent. Elements outside any <tag>
+    # are detached as they finish too, so the partially built tree never grows with the file
+    ancestors = []
+    open_matches = 0
+    for event, element in ET.iterparse(file, events=("start", "end")):
+        if event == "start":
+            ancestors.append(element)
+            if element.tag == tag:
+                open_matches += 1
+            continue
+        ancestors.pop()
+        if element.tag == tag:
+            open_matches -= 1
+            yield element
+        if open_matches == 0 and ancestors:
+            ancestors[-1].remove(element)
 
 # Single Responsibility Principle: Each class has one responsibility
 
 class Entity:
+    __slots__ = ('entity_id', 'name')
+
     def __init__(self, entity_id, name):
         self.entity_id = entity_id
         self.name = name
@@ -13,20 +42,61 @@ class Entity:
         return [self.entity_id, self.name]
 
 class Vehicle(Entity):
+    __slots__ = ('model',)
+
     def __init__(self, entity_id, name, model):
         super().__init__(entity_id, name)
         self.model = model
 
     def to_csv_row(self):
-        return super().to_csv_row() + [self.model]
+        return [self.entity_id, self.name, self.model]
 
 class Pedestrian(Entity):
+    __slots__ = ('age',)
+
     def __init__(self, entity_id, name, age):
         super().__init__(entity_id, name)
         self.age = age
 
     def to_csv_row(self):
-        return super().to_csv_row() + [self.age]
+        return [self.entity_id, self.name, self.age]
+
+# Column-oriented store for bulk writes: one sequence per field instead of a list of objects
+class EntityTable:
+    VEHICLE = 0
+    PEDESTRIAN = 1
+    ENTITY = 2  # Plain Entity, no Model/Age
+
+    def __init__(self):
+        self.ids = []  # Kept as given: ints when built in code, strs when read back from CSV/XML
+        self.names = []
+        self.kinds = array('b')
+        self.extras = []  # Vehicle model, pedestrian age or None, depending on kinds
+
+    @classmethod
+    def from_entities(cls, entities):
+        table = cls()
+        for entity in entities:
+            table.append(entity)
+        return table
+
+    def append(self, entity):
+        self.ids.append(entity.entity_id)
+        self.names.append(entity.name)
+        if isinstance(entity, Vehicle):
+            self.kinds.append(self.VEHICLE)
+            self.extras.append(entity.model)
+        elif isinstance(entity, Pedestrian):
+            self.kinds.append(self.PEDESTRIAN)
+            self.extras.append(entity.age)
+        elif type(entity) is Entity:
+            self.kinds.append(self.ENTITY)
+            self.extras.append(None)
+        else:
+            raise TypeError(f"EntityTable cannot store {type(entity).__name__} entities")
+
+    def __len__(self):
+        return len(self.ids)
 
 # Open/Closed Principle: Entities can be extended without modifying existing code
 
@@ -35,15 +105,25 @@ class CSVHandler:
         self.file_path = file_path
 
     def save_entities_to_csv(self, entities):
-        with open(self.file_path, mode='w', newline='') as file:
+        if isinstance(entities, EntityTable):
+            # Zipping the columns builds each row in C, with no per-entity method call
+            rows = zip(entities.ids, entities.names, entities.extras)
+            if EntityTable.ENTITY in entities.kinds:
+                # Plain entities have no Model/Age column, as in Entity.to_csv_row
+                rows = (row[:2] if kind == EntityTable.ENTITY else row for row, kind in zip(rows, entities.kinds))
+        else:
+            # Any other collection keeps each entity's own to_csv_row, so subclasses write their extra columns
+            rows = map(methodcaller('to_csv_row'), entities)
+        with open(self.file_path, mode='w', newline='', buffering=1 << 20) as file:
             writer = csv.writer(file)
             writer.writerow(["Entity ID", "Name", "Model/Age"])
-            for entity in entities:
-                writer.writerow(entity.to_csv_row())
+            writer.writerows(rows)
 
-    def read_entities_from_csv(self):
+    def read_entities_from_csv(self, use_pandas=False):
+        if use_pandas:
+            return self._read_entities_with_pandas()
         entities = []
-        with open(self.file_path, mode='r') as file:
+        with open(self.file_path, mode='r', newline='', buffering=1 << 20) as file:
             reader = csv.reader(file)
             next(reader)  # Skip header row
             for row in reader:
@@ -54,63 +134,108 @@ class CSVHandler:
                     entities.append(Vehicle(entity_id, name, attribute))
         return entities
 
+    def _read_entities_with_pandas(self):
+        # Opt-in bulk reader: parse with pandas' C engine and classify rows in one vectorized pass.
+        # Columns are positional as in the csv path, but pandas is more lenient: blank lines are
+        # skipped and short rows are padded with '' instead of raising
+        if pd is None:
+            raise ImportError("read_entities_from_csv(use_pandas=True) requires pandas")
+        try:
+            with open(self.file_path, mode='rb', buffering=1 << 20) as file:
+                frame = pd.read_csv(file, header=None, skiprows=1, dtype=str, keep_default_na=False, engine='c')
+        except pd.errors.EmptyDataError:  # Header only
+            return []
+        if frame.shape[1] != 3:
+            raise ValueError(f"expected 3 columns, got {frame.shape[1]}")
+        is_age = frame[2].str.isdigit()  # Assuming age is a digit
+        entities = []
+        for (entity_id, name, attribute), age in zip(frame.itertuples(index=False, name=None), is_age):
+            if age:
+                entities.append(Pedestrian(entity_id, name, int(attribute)))
+            else:
+                entities.append(Vehicle(entity_id, name, attribute))
+        return entities
+
 class XMLHandler:
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def parse_entities_from_xml(self):
-        tree = ET.parse(self.file_path)
-        root = tree.getroot()
-        parsed_entities = []
-        for entity in root.findall('.//Entity'):
-            entity_id = entity.get('id')
-            name = entity.find('Name').text
-            model = entity.find('Model')
-            if model is not None:
-                parsed_entities.append(Vehicle(entity_id, name, model.text))
-            else:
-                age = entity.find('Age').text
-                parsed_entities.append(Pedestrian(entity_id, name, age))
-        return parsed_entities
+    def parse_entities_from_xml(self, root=None):
+        # Reuse a tree that is already in memory instead of re-reading the file
+        if root is not None:
+            return [self._entity_from_element(entity) for entity in root.iter('Entity')]
+        # Stream the document, detaching each entity once handled so memory stays flat
+        with open(self.file_path, 'rb', buffering=1 << 17) as file:
+            return [self._entity_from_element(entity) for entity in _iterparse_detached(file, 'Entity')]
+
+    @staticmethod
+    def _entity_from_element(entity):
+        entity_id = entity.get('id')
+        name = entity.find('Name').text
+        model = entity.find('Model')
+        if model is not None:
+            return Vehicle(entity_id, name, model.text)
+        age = entity.find('Age').text
+        return Pedestrian(entity_id, name, age)
+
+    # Tag of the extra child element, indexed by EntityTable kind
+    _EXTRA_TAGS = ("Model", "Age", None)
+
+    @staticmethod
+    def _xml_record(entity):
+        if isinstance(entity, Vehicle):
+            return entity.entity_id, entity.name, "Model", entity.model
+        if isinstance(entity, Pedestrian):
+            return entity.entity_id, entity.name, "Age", entity.age
+        return entity.entity_id, entity.name, None, None
 
     def create_sample_xml(self, entities):
-        root = ET.Element("Entities")
-        for entity in entities:
-            entity_element = ET.SubElement(root, "Entity", id=str(entity.entity_id))
-            name_element = ET.SubElement(entity_element, "Name")
-            name_element.text = entity.name
-            if isinstance(entity, Vehicle):
-                model_element = ET.SubElement(entity_element, "Model")
-                model_element.text = entity.model
-            elif isinstance(entity, Pedestrian):
-                age_element = ET.SubElement(entity_element, "Age")
-                age_element.text = str(entity.age)
+        if isinstance(entities, EntityTable):
+            extra_tags = self._EXTRA_TAGS
+            records = ((entity_id, name, extra_tags[kind], extra) for entity_id, name, kind, extra
+                       in zip(entities.ids, entities.names, entities.kinds, entities.extras))
+        else:
+            # Any other entity type is written with just its Name, as before EntityTable existed
+            records = map(self._xml_record, entities)
+        # Feed the whole document through one TreeBuilder rather than creating SubElements
+        builder = ET.TreeBuilder()
+        builder.start("Entities", {})
+        for entity_id, name, extra_tag, extra in records:
+            builder.start("Entity", {"id": str(entity_id)})
+            builder.start("Name", {})
+            builder.data(name)
+            builder.end("Name")
+            if extra_tag is not None:
+                builder.start(extra_tag, {})
+                builder.data(str(extra))
+                builder.end(extra_tag)
+            builder.end("Entity")
+        builder.end("Entities")
+        root = builder.close()
+        # Pretty print in place and write once
+        ET.indent(root, space="   ")
         tree = ET.ElementTree(root)
-        with open(self.file_path, "wb") as file:
-            tree.write(file)
-
-        # Pretty print the XML
-        xml_str = minidom.parseString(ET.tostring(root)).toprettyxml(indent="   ")
-        with open(self.file_path, "w") as file:
-            file.write(xml_str)
+        tree.write(self.file_path, encoding="utf-8", xml_declaration=True)
+        return root
 
 class EntityComparator:
     @staticmethod
     def compare_entities(csv_entities, xml_entities):
+        # Index the XML side once so each CSV entity is a single lookup
+        xml_index = Counter((xml_entity.entity_id, xml_entity.name) for xml_entity in xml_entities)
         for csv_entity in csv_entities:
-            for xml_entity in xml_entities:
-                if csv_entity.entity_id == xml_entity.entity_id and csv_entity.name == xml_entity.name:
-                    print(f"Match found: {csv_entity.name} with ID {csv_entity.entity_id}")
+            for _ in range(xml_index[(csv_entity.entity_id, csv_entity.name)]):
+                print(f"Match found: {csv_entity.name} with ID {csv_entity.entity_id}")
 
 # Example usage
 
 # Creating entities
-entities = [
+entities = EntityTable.from_entities([
     Vehicle(1, 'Car A', 'Model X'),
     Pedestrian(2, 'John Doe', 30),
     Vehicle(3, 'Car B', 'Model Y'),
     Pedestrian(4, 'Jane Doe', 25)
-]
+])
 
 # Saving entities to CSV
 csv_file_path = 'scenario.csv'  # Specify your CSV file path
@@ -120,9 +245,9 @@ csv_handler.save_entities_to_csv(entities)
 # Creating a sample XML file with the same entities
 xml_file_path = 'sample_scenario.xml'  # Specify your XML file path
 xml_handler = XMLHandler(xml_file_path)
-xml_handler.create_sample_xml(entities)
+xml_root = xml_handler.create_sample_xml(entities)
 
-# Reading and comparing entities from CSV and XML
+# Reading and comparing entities from CSV and XML (the XML tree is reused, not re-parsed)
 csv_entities = csv_handler.read_entities_from_csv()
-xml_entities = xml_handler.parse_entities_from_xml()
+xml_entities = xml_handler.parse_entities_from_xml(root=xml_root)
 EntityComparator.compare_entities(csv_entities, xml_entities)
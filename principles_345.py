@@ -1,21 +1,57 @@
 import csv
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-from abc import ABC, abstractmethod
+import io
+import locale
+import os
+from operator import methodcaller
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+from typing import Iterable, Optional, Protocol
+from xml.sax.saxutils import escape
 
 # Interface Segregation Principle (ISP)
-class CSVExportable(ABC):
-    @abstractmethod
+class CSVExportable(Protocol):
     def to_csv_row(self):
-        pass
+        ...
 
-class XMLExportable(ABC):
-    @abstractmethod
+class XMLExportable(Protocol):
     def to_xml_element(self):
-        pass
+        ...
+
+    def to_xml_bytes(self):
+        ...
+
+# Escapes for XML template values; quotes and whitespace become references so attributes round-trip
+_XML_ESCAPES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#09;'}
+
+class _EscapedFields:
+    # str.format_map view of an entity that XML-escapes each field as the template reads it
+    __slots__ = ('entity',)
+
+    def __init__(self, entity):
+        self.entity = entity
+
+    def __getitem__(self, field):
+        return escape(str(getattr(self.entity, field)), _XML_ESCAPES)
+
+# Entity classes implementing interfaces (structurally, no runtime ABC checks)
+class Entity:
+    __slots__ = ('entity_id', 'name')
+
+    # XML tag names, shared by every to_xml_element
+    _TAG = "Entity"
+    _NAME_TAG = "Name"
+
+    # Fixed-schema fast path for to_xml_bytes; None means serialize through to_xml_element
+    _XML_TEMPLATE: Optional[str] = '<Entity id="{entity_id}"><Name>{name}</Name></Entity>'
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass that customizes to_xml_element without its own template is saved through that method
+        if 'to_xml_element' in vars(cls) and '_XML_TEMPLATE' not in vars(cls):
+            cls._XML_TEMPLATE = None
 
-# Entity classes implementing interfaces
-class Entity(CSVExportable, XMLExportable):
     def __init__(self, entity_id, name):
         self.entity_id = entity_id
         self.name = name
@@ -24,64 +60,108 @@ class Entity(CSVExportable, XMLExportable):
         return [self.entity_id, self.name]
 
     def to_xml_element(self):
-        entity_element = ET.Element("Entity", id=str(self.entity_id))
-        name_element = ET.SubElement(entity_element, "Name")
+        entity_element = ET.Element(self._TAG, id=str(self.entity_id))
+        name_element = ET.SubElement(entity_element, self._NAME_TAG)
         name_element.text = self.name
         return entity_element
 
+    def to_xml_bytes(self):
+        if self._XML_TEMPLATE is None:
+            return ET.tostring(self.to_xml_element())
+        # Fill the class's template instead of building an element tree
+        return self._XML_TEMPLATE.format_map(_EscapedFields(self)).encode('ascii', 'xmlcharrefreplace')
+
 class Vehicle(Entity):
+    __slots__ = ('model',)
+
+    _MODEL_TAG = "Model"
+    _XML_TEMPLATE = '<Entity id="{entity_id}"><Name>{name}</Name><Model>{model}</Model></Entity>'
+
     def __init__(self, entity_id, name, model):
         super().__init__(entity_id, name)
         self.model = model
 
     def to_csv_row(self):
-        return super().to_csv_row() + [self.model]
+        return [self.entity_id, self.name, self.model]
 
     def to_xml_element(self):
-        entity_element = super().to_xml_element()
-        model_element = ET.SubElement(entity_element, "Model")
+        entity_element = ET.Element(self._TAG, id=str(self.entity_id))
+        name_element = ET.SubElement(entity_element, self._NAME_TAG)
+        name_element.text = self.name
+        model_element = ET.SubElement(entity_element, self._MODEL_TAG)
         model_element.text = self.model
         return entity_element
 
 class Pedestrian(Entity):
+    __slots__ = ('age',)
+
+    _AGE_TAG = "Age"
+    _XML_TEMPLATE = '<Entity id="{entity_id}"><Name>{name}</Name><Age>{age}</Age></Entity>'
+
     def __init__(self, entity_id, name, age):
         super().__init__(entity_id, name)
         self.age = age
 
     def to_csv_row(self):
-        return super().to_csv_row() + [self.age]
+        return [self.entity_id, self.name, self.age]
 
     def to_xml_element(self):
-        entity_element = super().to_xml_element()
-        age_element = ET.SubElement(entity_element, "Age")
+        entity_element = ET.Element(self._TAG, id=str(self.entity_id))
+        name_element = ET.SubElement(entity_element, self._NAME_TAG)
+        name_element.text = self.name
+        age_element = ET.SubElement(entity_element, self._AGE_TAG)
         age_element.text = str(self.age)
         return entity_element
 
 # Dependency Inversion Principle (DIP)
-class PersistenceHandler(ABC):
-    @abstractmethod
+class PersistenceHandler(Protocol):
     def save(self, entity: Entity):
-        pass
+        ...
+
+    def save_all(self, entities: Iterable[Entity]):
+        ...
+
+class CSVHandler:
+    _HEADER = ["Entity ID", "Name", "Model/Age"]
 
-class CSVHandler(PersistenceHandler):
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def save(self, entity: Entity):
-        with open(self.file_path, mode='w', newline='') as file:
+    def save(self, entity: CSVExportable):
+        # Two rows only: format in memory, then hand the bytes to the OS in one unbuffered write
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self._HEADER)
+        writer.writerow(entity.to_csv_row())
+        # Same encoding open() uses for save_all, so both methods agree on non-ASCII names
+        data = memoryview(buffer.getvalue().encode(locale.getpreferredencoding(False)))
+        fd = os.open(self.file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            # os.write may write fewer bytes than asked; keep going until everything is out
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def save_all(self, entities: Iterable[CSVExportable]):
+        # Stream rows through a large buffer rather than building the whole file in memory
+        with open(self.file_path, mode='w', newline='', buffering=1 << 20) as file:
             writer = csv.writer(file)
-            writer.writerow(["Entity ID", "Name", "Model/Age"])
-            writer.writerow(entity.to_csv_row())
+            writer.writerow(self._HEADER)
+            writer.writerows(map(methodcaller('to_csv_row'), entities))
 
-class XMLHandler(PersistenceHandler):
+class XMLHandler:
     def __init__(self, file_path):
         self.file_path = file_path
 
-    def save(self, entity: Entity):
-        root = ET.Element("Entities")
-        root.append(entity.to_xml_element())
-        tree = ET.ElementTree(root)
-        tree.write(self.file_path)
+    def save(self, entity: XMLExportable):
+        self.save_all([entity])
+
+    def save_all(self, entities: Iterable[XMLExportable]):
+        # Render each entity from its template and write the whole document at once
+        xml_bytes = b''.join([b'<Entities>', *map(methodcaller('to_xml_bytes'), entities), b'</Entities>'])
+        with open(self.file_path, 'wb') as file:
+            file.write(xml_bytes)
 
 # High-level module depending on abstraction
 class EntitySaver:
@@ -91,6 +171,9 @@ class EntitySaver:
     def save(self, entity: Entity):
         self.handler.save(entity)
 
+    def save_all(self, entities: Iterable[Entity]):
+        self.handler.save_all(entities)
+
 # Example usage demonstrating LSP
 entities = [
     Vehicle(1, 'Car A', 'Model X'),
@@ -103,6 +186,5 @@ xml_handler = XMLHandler('entities.xml')
 csv_saver = EntitySaver(csv_handler)
 xml_saver = EntitySaver(xml_handler)
 
-for entity in entities:
-    csv_saver.save(entity)
-    xml_saver.save(entity)
+csv_saver.save_all(entities)
+xml_saver.save_all(entities)